@@ -3,7 +3,7 @@ from django.core.management.base import BaseCommand
 from django.utils import timezone
 from datetime import date, timedelta
 from interactions.models import ServiceEntry, ServiceCenter
-from ...services.sms_service import SMSService
+from ...services.sms_service import get_sms_service
 import logging
 from django.db import models
 
@@ -27,24 +27,30 @@ class Command(BaseCommand):
     def handle(self, *args, **options):
         dry_run = options['dry_run']
         service_center_id = options.get('service_center_id')
-        
+
         self.stdout.write("Starting SMS reminder process...")
-        
+
+        # Buffer SMS log rows and flush them in one bulk_create at the end
+        # instead of one INSERT per SMS on the sending path
+        self.sms_log_buffer = []
+
         # Get active service centers
         service_centers = ServiceCenter.objects.filter(is_active=True)
         if service_center_id:
             service_centers = service_centers.filter(id=service_center_id)
-        
+
         total_sent = 0
-        
+
         for service_center in service_centers:
             if not service_center.can_access_service():
                 self.stdout.write(f"Skipping {service_center.name} - subscription expired")
                 continue
-                
+
             sent_count = self.send_reminders_for_service_center(service_center, dry_run)
             total_sent += sent_count
-            
+
+        self.flush_sms_logs()
+
         self.stdout.write(
             self.style.SUCCESS(f'Successfully processed {total_sent} SMS reminders')
         )
@@ -122,8 +128,8 @@ class Command(BaseCommand):
                 )
                 return True
             
-            # Send actual SMS
-            sms_service = SMSService()
+            # Send actual SMS through the shared pooled service
+            sms_service = get_sms_service()
             success = sms_service.send_service_reminder(
                 phone=service_entry.customer.phone,
                 message=message,
@@ -175,10 +181,10 @@ Contact: {service_entry.service_center.phone}
         return message
     
     def log_sms(self, service_entry, message, status, error_message=None):
-        """Log SMS sending attempt"""
+        """Buffer SMS sending attempt for bulk logging"""
         from ...models import SMSLog
-        
-        SMSLog.objects.create(
+
+        self.sms_log_buffer.append(SMSLog(
             customer=service_entry.customer,
             vehicle=service_entry.vehicle,
             service_center=service_entry.service_center,
@@ -189,7 +195,15 @@ Contact: {service_entry.service_center.phone}
             status=status,
             error_message=error_message,
             sent_at=timezone.now()
-        )
+        ))
+
+    def flush_sms_logs(self):
+        """Write all buffered SMS logs in one batched insert"""
+        from ...models import SMSLog
+
+        if self.sms_log_buffer:
+            SMSLog.objects.bulk_create(self.sms_log_buffer, batch_size=1000)
+            self.sms_log_buffer = []
 
 
 
@@ -0,0 +1,29 @@
+# Generated by Django 5.2.17 on 2026-08-27 16:11
+
+from datetime import timedelta
+
+from django.db import migrations, models
+
+
+def backfill_expires_at(apps, schema_editor):
+    """Give pre-existing OTP rows the expiry save() would have set"""
+    PasswordResetOTP = apps.get_model('index', 'PasswordResetOTP')
+    PasswordResetOTP.objects.filter(expires_at__isnull=True).update(
+        expires_at=models.F('created_at') + timedelta(minutes=10)
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('index', '0007_alter_customuser_phone_number'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='passwordresetotp',
+            name='expires_at',
+            field=models.DateTimeField(blank=True, db_index=True, null=True),
+        ),
+        migrations.RunPython(backfill_expires_at, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.17 on 2026-08-27 16:23
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('index', '0008_passwordresetotp_expires_at'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='subscription',
+            index=models.Index(fields=['service_center', 'status', '-started_at'], name='sub_active_idx'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.17 on 2026-08-27 16:25
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('index', '0009_subscription_sub_active_idx'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='subscription',
+            index=models.Index(condition=models.Q(('status__in', ['trial', 'active'])), fields=['service_center', '-started_at'], name='sub_live_idx'),
+        ),
+    ]
@@ -1,10 +1,11 @@
 from django.contrib.auth.models import AbstractBaseUser, BaseUserManager, PermissionsMixin
-from django.db import models
+from django.db import models, transaction
 from django.core.validators import RegexValidator
 from django.utils import timezone
+from django.utils.functional import cached_property
 from datetime import timedelta, date
+from dateutil.relativedelta import relativedelta
 import uuid
-from datetime import timedelta, date
 
 
 
@@ -82,28 +83,37 @@ class ServiceCenter(models.Model):
         
         super().save(*args, **kwargs)
 
-    def is_trial_active(self):
+    def is_trial_active(self, now=None):
         """Check if trial period is still active"""
-        return timezone.now() < self.trial_ends_at if self.trial_ends_at else False
+        if not self.trial_ends_at:
+            return False
+        return (now or timezone.now()) < self.trial_ends_at
 
-    def is_subscription_active(self):
+    def is_subscription_active(self, today=None):
         """Check if subscription is active"""
         if not self.subscription_valid_until:
             return False
-        return date.today() <= self.subscription_valid_until
+        return (today or date.today()) <= self.subscription_valid_until
 
-    def can_access_service(self):
-        """Check if service center can access the application"""
-        return self.is_active and (self.is_trial_active() or self.is_subscription_active())
+    def can_access_service(self, now=None):
+        """Check if service center can access the application
+
+        Callers serializing many centers can pass one shared ``now`` so the
+        clock is read once per response instead of several times per row.
+        """
+        if not self.is_active:
+            return False
+        if now is None:
+            return self.is_trial_active() or self.is_subscription_active()
+        return (
+            self.is_trial_active(now)
+            or self.is_subscription_active(timezone.localdate(now))
+        )
 
     def __str__(self):
         return self.name
     
     def extend_subscription(self, months=12, payment_transaction=None):
-    
-        from datetime import date, timedelta
-        from dateutil.relativedelta import relativedelta
-        
         # Determine the start date for extension
         if self.is_subscription_active():
             # Extend from current subscription end date
@@ -118,12 +128,15 @@ class ServiceCenter(models.Model):
             start_date = date.today()
             new_end_date = start_date + relativedelta(months=months)
         
-        # Update service center subscription
+        # Update service center subscription; only the touched columns go
+        # over the wire instead of a full-row rewrite
         self.subscription_valid_until = new_end_date
         if not self.subscription_started_at:
             self.subscription_started_at = timezone.now()
-        
-        self.save()
+
+        self.save(update_fields=[
+            'subscription_valid_until', 'subscription_started_at', 'updated_at'
+        ])
         SubscriptionHistory.objects.create(
         service_center=self,
         payment_transaction=payment_transaction,
@@ -134,11 +147,66 @@ class ServiceCenter(models.Model):
         amount_paid=payment_transaction.amount if payment_transaction else 0,
         is_extension=True
         )
-    
+
+        # Drop the memoized status so callers see the extended dates
+        self.__dict__.pop('_subscription_status', None)
+
         return new_end_date
 
-    def get_subscription_status(self):
-        """Get detailed subscription status"""
+    @classmethod
+    def extend_subscription_bulk(cls, service_centers, months=12):
+        """
+        Extend subscriptions for many service centers in two round-trips.
+
+        Calling extend_subscription in a loop issues one UPDATE and one
+        INSERT per center; this computes the new dates in Python, then does
+        a single bulk_update plus a single bulk_create for the history rows.
+        """
+        now = timezone.now()
+        tz = timezone.get_current_timezone()
+        history_rows = []
+
+        for service_center in service_centers:
+            if service_center.is_subscription_active():
+                start_date = service_center.subscription_valid_until
+            elif service_center.is_trial_active():
+                start_date = service_center.trial_ends_at.date()
+            else:
+                start_date = date.today()
+            new_end_date = start_date + relativedelta(months=months)
+
+            service_center.subscription_valid_until = new_end_date
+            if not service_center.subscription_started_at:
+                service_center.subscription_started_at = now
+            # bulk_update skips auto_now, so bump updated_at by hand
+            service_center.updated_at = now
+
+            # Drop the memoized status so callers see the extended dates
+            service_center.__dict__.pop('_subscription_status', None)
+
+            history_rows.append(SubscriptionHistory(
+                service_center=service_center,
+                started_at=now,
+                expires_at=timezone.datetime.combine(new_end_date, timezone.datetime.min.time()).replace(tzinfo=tz),
+                previous_expires_at=timezone.datetime.combine(start_date, timezone.datetime.min.time()).replace(tzinfo=tz) if start_date != date.today() else None,
+                plan_name=f"{months // 12} Year Extension" if months % 12 == 0 else f"{months} Month Extension",
+                amount_paid=0,
+                is_extension=True
+            ))
+
+        with transaction.atomic():
+            cls.objects.bulk_update(
+                service_centers,
+                ['subscription_valid_until', 'subscription_started_at', 'updated_at'],
+                batch_size=500
+            )
+            SubscriptionHistory.objects.bulk_create(history_rows, batch_size=500)
+
+        return service_centers
+
+    @cached_property
+    def _subscription_status(self):
+        """Compute detailed subscription status (memoized per instance)"""
         status = {
             'can_access': self.can_access_service(),
             'is_trial_active': self.is_trial_active(),
@@ -149,21 +217,41 @@ class ServiceCenter(models.Model):
             'status_text': 'Inactive'
         }
         
+        today_ordinal = date.today().toordinal()
+
         if self.is_subscription_active():
-            days_remaining = (self.subscription_valid_until - date.today()).days
+            # Ordinal subtraction is a plain int op, no timedelta allocation
+            days_remaining = self.subscription_valid_until.toordinal() - today_ordinal
             status['days_remaining'] = days_remaining
             status['status_text'] = f'Active ({days_remaining} days remaining)'
         elif self.is_trial_active():
-            days_remaining = (self.trial_ends_at.date() - date.today()).days
+            days_remaining = self.trial_ends_at.date().toordinal() - today_ordinal
             status['days_remaining'] = days_remaining
             status['status_text'] = f'Trial ({days_remaining} days remaining)'
         elif not self.is_active:
             status['status_text'] = 'Account Disabled'
         else:
             status['status_text'] = 'Subscription Expired'
-        
+
         return status
 
+    def get_subscription_status(self):
+        """Get detailed subscription status"""
+        return self._subscription_status
+
+    @property
+    def current_active_subscription(self):
+        """Current trial/active subscription, served from the prefetch cache
+        (_active_subs) when the view supplied one"""
+        active_subs = getattr(self, '_active_subs', None)
+        if active_subs is None:
+            # Ordered slice matches the composite index on
+            # (service_center, status, -started_at)
+            active_subs = self.subscriptions.filter(
+                status__in=['trial', 'active']
+            ).order_by('-started_at')[:1]
+        return active_subs[0] if active_subs else None
+
 
 class LicenseKey(models.Model):
     """Model for managing license keys (if you need separate license management)"""
@@ -311,6 +399,16 @@ class Subscription(models.Model):
 
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            # Covers the "latest trial/active subscription per center" lookup
+            models.Index(fields=['service_center', 'status', '-started_at'],
+                         name='sub_active_idx'),
+            # Partial index over just the live rows; most subscriptions end
+            # up expired/cancelled, so this stays small and hot
+            models.Index(fields=['service_center', '-started_at'],
+                         name='sub_live_idx',
+                         condition=models.Q(status__in=['trial', 'active'])),
+        ]
 
     def __str__(self):
         return f"{self.service_center.name} - {self.get_status_display()}"
@@ -522,11 +620,17 @@ class PasswordResetOTP(models.Model):
     user = models.ForeignKey(CustomUser, on_delete=models.CASCADE)
     otp = models.CharField(max_length=6)
     created_at = models.DateTimeField(auto_now_add=True)
+    expires_at = models.DateTimeField(db_index=True, null=True, blank=True)
     is_used = models.BooleanField(default=False)
 
+    def save(self, *args, **kwargs):
+        # Set expiry once at insert time (OTP valid for 10 minutes)
+        if not self.expires_at:
+            self.expires_at = timezone.now() + timedelta(minutes=10)
+        super().save(*args, **kwargs)
+
     def is_valid(self):
-        # OTP valid for 10 minutes
-        return timezone.now() <= self.created_at + timedelta(minutes=10)
+        return not self.is_used and timezone.now() <= self.expires_at
 
 
 
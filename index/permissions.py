@@ -2,30 +2,46 @@
 from rest_framework import permissions
 from rest_framework.permissions import BasePermission
 
+# Roles allowed to manage service center resources.
+# Module-level frozenset so the hot-path membership test is a single O(1)
+# lookup instead of rebuilding a list on every request.
+MANAGER_ROLES = frozenset(('admin', 'centeradmin'))
+
+
+def _is_auth(request):
+    """
+    Resolve request.user.is_authenticated once per request.
+
+    Views often stack several of these permission classes, and each
+    has_permission call would otherwise hit the is_authenticated property
+    descriptor again. The first check stores the result as a plain bool on
+    the request so subsequent checks are a single attribute load.
+    """
+    is_auth = getattr(request, '_is_auth', None)
+    if is_auth is None:
+        is_auth = request._is_auth = bool(request.user.is_authenticated)
+    return is_auth
+
 
 class IsAuthenticatedForSwagger(BasePermission):
     def has_permission(self, request, view):
-        return request.user and request.user.is_authenticated
-    
+        return _is_auth(request)
+
 class IsAdmin(permissions.BasePermission):
     """
     Custom permission to only allow admin users to access this view.
     """
     def has_permission(self, request, view):
         # Check if the user is authenticated and has the 'admin' role
-        return request.user and request.user.is_authenticated and request.user.role == 'admin' 
+        return _is_auth(request) and request.user.role == 'admin'
+
 
- 
 class IsCenterAdmin(permissions.BasePermission):
     """
     Allows access to users with role 'centeradmin' or 'admin'
     """
     def has_permission(self, request, view):
-        return (
-            request.user and 
-            request.user.is_authenticated and 
-            request.user.role in ['centeradmin', 'admin']
-        ) 
+        return _is_auth(request) and request.user.role in MANAGER_ROLES
 
 
 class CanManageServiceCenterUsers(permissions.BasePermission):
@@ -35,11 +51,7 @@ class CanManageServiceCenterUsers(permissions.BasePermission):
     - Center Admin: Can manage users in their service center only
     """
     def has_permission(self, request, view):
-        return (
-            request.user and 
-            request.user.is_authenticated and 
-            request.user.role in ['admin', 'centeradmin']
-        )
+        return _is_auth(request) and request.user.role in MANAGER_ROLES
     
     def has_object_permission(self, request, view, obj):
         user = request.user
@@ -61,8 +73,8 @@ class CanChangeUserPassword(permissions.BasePermission):
     Permission for changing user passwords
     """
     def has_permission(self, request, view):
-        return request.user and request.user.is_authenticated
-    
+        return _is_auth(request)
+
     def has_object_permission(self, request, view, obj):
         user = request.user
         
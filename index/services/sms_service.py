@@ -1,19 +1,42 @@
 # services/sms_service.py - SMS sending service
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
 import requests
+from requests.adapters import HTTPAdapter
 from django.conf import settings
 from django.utils import timezone
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Deletion table scrubbing non-digits in one C-level translate pass
+_DIGIT_TABLE = str.maketrans(
+    '', '', ''.join(chr(c) for c in range(256) if not chr(c).isdigit())
+)
+
+# Provider settings are frozen once at import instead of three getattr
+# lookups per instantiation
+_API_KEY = getattr(settings, 'SMS_API_KEY', '')
+_SENDER_ID = getattr(settings, 'SMS_SENDER_ID', 'ServiceCenter')
+_API_URL = getattr(settings, 'SMS_API_URL', '')
+
 class SMSService:
     """Service class for sending SMS notifications"""
-    
+
     def __init__(self):
         # Configure your SMS provider settings
-        self.api_key = getattr(settings, 'SMS_API_KEY', '')
-        self.sender_id = getattr(settings, 'SMS_SENDER_ID', 'ServiceCenter')
-        self.api_url = getattr(settings, 'SMS_API_URL', '')
+        self.api_key = _API_KEY
+        self.sender_id = _SENDER_ID
+        self.api_url = _API_URL
+
+        # One pooled session reuses TCP/TLS connections across sends
+        # instead of paying a fresh handshake per requests.post call; the
+        # pool is sized for the bulk fan-out below
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=32, pool_maxsize=32)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
     
     def send_service_reminder(self, phone, message, service_entry=None):
         """Send service reminder SMS"""
@@ -27,7 +50,7 @@ class SMSService:
         """Generic SMS sending method"""
         try:
             # Format phone number (remove any non-digits)
-            clean_phone = ''.join(filter(str.isdigit, phone))
+            clean_phone = phone.translate(_DIGIT_TABLE)
             
             # Add country code if not present
             if not clean_phone.startswith('91') and len(clean_phone) == 10:
@@ -43,7 +66,7 @@ class SMSService:
             }
             
             # Send SMS via your provider's API
-            response = requests.post(self.api_url, data=sms_data, timeout=10)
+            response = self.session.post(self.api_url, data=sms_data, timeout=10)
             
             if response.status_code == 200:
                 response_data = response.json()
@@ -63,16 +86,35 @@ class SMSService:
             return False
     
     def send_bulk_sms(self, sms_list):
-        """Send bulk SMS messages"""
-        results = []
-        for sms_data in sms_list:
+        """
+        Send bulk SMS messages
+
+        The sends are pure blocking I/O, so they are dispatched over a
+        thread pool: N messages overlap on the wire instead of paying
+        N sequential round-trips. Result order matches sms_list.
+        """
+        def send_one(sms_data):
             result = self.send_sms(
                 phone=sms_data['phone'],
                 message=sms_data['message'],
                 sms_type=sms_data.get('type', 'service_reminder')
             )
-            results.append({
+            return {
                 'phone': sms_data['phone'],
                 'success': result
-            })
-        return results
+            }
+
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            return list(executor.map(send_one, sms_list))
+
+
+@lru_cache(maxsize=1)
+def get_sms_service():
+    """
+    Process-wide SMSService singleton.
+
+    Callers that construct SMSService() per message rebuild the pooled
+    session (and lose its keep-alive connections) every time; this hands
+    out one shared instance per worker instead.
+    """
+    return SMSService()
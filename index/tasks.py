@@ -1,13 +1,56 @@
-from celery import shared_task
-from django.core.management import call_command
+import requests
+from celery import group, shared_task
 
-@shared_task
+from interactions.reminders import send_service_reminders
+
+@shared_task(acks_late=True, ignore_result=True)
 def send_daily_service_reminders():
     """Celery task to send daily service reminders"""
-    call_command('send_service_reminders')
+    # Direct call skips call_command's registry scan and option re-parsing
+    send_service_reminders()
 
-@shared_task
+@shared_task(acks_late=True, ignore_result=True)
 def send_service_center_reminders(service_center_id):
     """Send reminders for specific service center"""
-    call_command('send_service_reminders', service_center_id=service_center_id)
+    send_service_reminders(service_center_id=service_center_id)
+
+@shared_task(bind=True, autoretry_for=(requests.RequestException,),
+             retry_backoff=True, max_retries=3)
+def send_sms_task(self, phone, message, sms_type='service_reminder'):
+    """
+    Send one SMS on a Celery worker.
+
+    Request-path callers should enqueue this with .delay() instead of
+    calling SMSService().send_sms inline, so the web worker is never
+    blocked on the provider's HTTP round-trip (up to the 10s timeout).
+    """
+    from .services.sms_service import get_sms_service
+
+    return get_sms_service().send_sms(phone, message, sms_type=sms_type)
+
+
+def enqueue_bulk_sms(sms_list):
+    """
+    Fan a bulk send out across Celery workers, one task per message.
+
+    Returns the group result so callers can join on it if they need
+    delivery outcomes.
+    """
+    return group(
+        send_sms_task.s(
+            sms_data['phone'],
+            sms_data['message'],
+            sms_data.get('type', 'service_reminder')
+        )
+        for sms_data in sms_list
+    ).apply_async()
+
+
+@shared_task
+def cleanup_expired_password_reset_otps():
+    """Delete password reset OTPs past their expiry"""
+    from django.utils import timezone
+    from .models import PasswordResetOTP
+
+    PasswordResetOTP.objects.filter(expires_at__lt=timezone.now()).delete()
 
@@ -2,7 +2,6 @@
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
 from . import views
-from rest_framework.routers import DefaultRouter
 from .views import UserManagementViewSet, AdminServiceCenterUserViewSet
 
 
@@ -22,7 +21,8 @@ urlpatterns = [
     path('service-centers/register/', views.ServiceCenterRegistrationView.as_view(), name='service-center-register'),
     path('service-centers/', views.ServiceCenterListView.as_view(), name='service-center-list'),
     path('service-centers/<int:pk>/', views.ServiceCenterDetailView.as_view(), name='service-center-detail'),
-    
+    path('service-centers/<int:service_center_id>/users/stream/', views.service_center_users_stream, name='service-center-users-stream'),
+
     # Subscription Management
     path('service-centers/<int:service_center_id>/activate-subscription/', views.activate_subscription, name='activate-subscription'),
     path('service-centers/<int:service_center_id>/subscription-status/', views.subscription_status, name='subscription-status'),
@@ -1,43 +1,59 @@
 # utils.py
 
 import random
+import re
+import secrets
 import string
 from django.utils.crypto import get_random_string
 
+# Deletion table scrubbing non-digits in one C-level translate pass,
+# instead of a Python-level callback per character with filter(str.isdigit)
+_DIGIT_TABLE = str.maketrans(
+    '', '', ''.join(chr(c) for c in range(256) if not chr(c).isdigit())
+)
+
+
+# Charset built once; license keys are credentials, so segments are drawn
+# from the CSPRNG rather than the seedable random module
+_KEY_CHARS = string.ascii_uppercase + string.digits
+
 
 def generate_license_key(length=20):
     """
     Generate a unique license key
     Format: XXXX-XXXX-XXXX-XXXX-XXXX (20 characters with dashes)
     """
-    # Generate random alphanumeric string
-    chars = string.ascii_uppercase + string.digits
-    key_parts = []
-    
-    # Create 4-character segments
-    for _ in range(5):
-        segment = ''.join(random.choices(chars, k=4))
-        key_parts.append(segment)
-    
-    return '-'.join(key_parts)
+    return '-'.join(
+        ''.join(secrets.choice(_KEY_CHARS) for _ in range(4))
+        for _ in range(5)
+    )
 
 
-def generate_unique_license_key():
+def generate_unique_license_key(candidates=8):
     """
     Generate a unique license key that doesn't already exist in database
+
+    Generates a small pool of candidates and collision-checks the whole
+    pool in two key__in queries, instead of a retry loop costing two
+    exists() round-trips per attempt.
     """
     from .models import LicenseKey, ServiceCenter
-    
-    max_attempts = 100
-    for _ in range(max_attempts):
-        key = generate_license_key()
-        
-        # Check if key exists in either model
-        if not (LicenseKey.objects.filter(key=key).exists() or 
-                ServiceCenter.objects.filter(license_key=key).exists()):
+
+    pool = [generate_license_key() for _ in range(candidates)]
+
+    # Check the whole pool against both models at once
+    taken = set(
+        LicenseKey.objects.filter(key__in=pool).values_list('key', flat=True)
+    )
+    taken.update(
+        ServiceCenter.objects.filter(license_key__in=pool)
+        .values_list('license_key', flat=True)
+    )
+    for key in pool:
+        if key not in taken:
             return key
-    
-    # Fallback to crypto-based generation if random generation fails
+
+    # Fallback to crypto-based generation if the entire pool collides
     return get_random_string(20).upper()
 
 
@@ -61,8 +77,8 @@ def format_phone_number(phone):
     Format phone number to standard format
     """
     # Remove all non-numeric characters
-    phone_digits = ''.join(filter(str.isdigit, phone))
-    
+    phone_digits = phone.translate(_DIGIT_TABLE)
+
     # Add country code if missing
     if len(phone_digits) == 10:
         phone_digits = '91' + phone_digits  # India country code
@@ -72,15 +88,31 @@ def format_phone_number(phone):
     return '+' + phone_digits
 
 
+# Expected format: XXXX-XXXX-XXXX-XXXX-XXXX; compiled once at import
+# so each validation is a single cached-pattern match
+_LICENSE_KEY_RE = re.compile(r'^(?:[A-Z0-9]{4}-){4}[A-Z0-9]{4}$')
+
+
 def validate_license_key_format(license_key):
     """
     Validate license key format
     Returns True if format is valid, False otherwise
     """
-    import re
-    
-    # Expected format: XXXX-XXXX-XXXX-XXXX-XXXX
-    pattern = r'^[A-Z0-9]{4}-[A-Z0-9]{4}-'
+    return bool(_LICENSE_KEY_RE.match(license_key))
+
+
+def prefetch_service_centers(ids):
+    """
+    Fetch many service centers in one query, keyed by id.
+
+    Back-office flows (reconciliation, bulk extensions) that resolve
+    centers one .get(id=...) at a time should fetch the whole batch up
+    front with this and pass the instances along, e.g. into
+    ServiceCenter.extend_subscription_bulk.
+    """
+    from .models import ServiceCenter
+
+    return ServiceCenter.objects.in_bulk(ids)
 
 
 def generate_otp():
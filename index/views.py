@@ -41,10 +41,14 @@ class MyTokenObtainPairView(TokenObtainPairView):
 
 from rest_framework import generics, status, permissions
 from rest_framework.decorators import api_view, permission_classes
+from rest_framework.pagination import CursorPagination
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated, AllowAny
 from django.shortcuts import get_object_or_404
+from django.core.serializers.json import DjangoJSONEncoder
 from django.db import transaction
+from django.db.models import Count, Prefetch
+from django.http import StreamingHttpResponse
 from django.utils import timezone
 from datetime import timedelta
 
@@ -60,6 +64,42 @@ from .serializers import (
 )
 
 
+class RecentFirstCursorPagination(CursorPagination):
+    """
+    Cursor pagination ordered newest-first.
+
+    Cursor paging seeks straight to the page via the ordering column's
+    index instead of OFFSET-scanning and discarding every earlier row,
+    which keeps deep pages as cheap as the first one.
+    """
+    page_size = 50
+    ordering = '-created_at'
+
+
+class AutoSelectRelatedMixin:
+    """
+    Infer select_related() from the serializer's declared fields.
+
+    Any field whose source traverses a relation (e.g. 'service_center.name')
+    forces a per-row query during list serialization unless the relation is
+    joined up front. This mixin collects those relation prefixes from the
+    serializer and applies select_related automatically, so list views don't
+    have to maintain the relation list by hand.
+    """
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+        serializer = self.get_serializer_class()()
+        related = {
+            field.source.rsplit('.', 1)[0].replace('.', '__')
+            for field in serializer.fields.values()
+            if '.' in (field.source or '')
+        }
+        if related:
+            queryset = queryset.select_related(*related)
+        return queryset
+
+
 class ServiceCenterRegistrationView(generics.CreateAPIView):
     """
     API endpoint for registering a new service center with admin user
@@ -131,6 +171,43 @@ class ServiceCenterRegistrationView(generics.CreateAPIView):
             }, status=status.HTTP_400_BAD_REQUEST)
 
 
+def _with_detail_relations(queryset):
+    """
+    Attach the relations ServiceCenterDetailSerializer renders: user count,
+    active subscriptions (to _active_subs) and the narrowed users prefetch.
+    The root rows are narrowed to the serializer's columns as well.
+    """
+    return queryset.only(
+        'id', 'name', 'address', 'email', 'phone', 'license_key',
+        'is_active', 'trial_started_at', 'trial_ends_at',
+        'subscription_started_at', 'subscription_valid_until',
+        'razorpay_customer_id', 'razorpay_subscription_id',
+        'created_at', 'updated_at'
+    ).annotate(_total_users=Count('users')).prefetch_related(
+        Prefetch(
+            'subscriptions',
+            queryset=Subscription.objects.filter(
+                status__in=['trial', 'active']
+            ).only(
+                # service_center_id must stay, or stitching the prefetch
+                # back onto each center re-queries per row
+                'id', 'status', 'started_at', 'expires_at', 'amount',
+                'service_center_id'
+            # Match the order current_active_subscription's fallback uses
+            ).order_by('-started_at'),
+            to_attr='_active_subs'
+        ),
+        Prefetch(
+            'users',
+            queryset=CustomUser.objects.only(
+                'id', 'username', 'email', 'phone_number', 'role',
+                'is_active', 'is_staff', 'date_joined', 'last_login',
+                'service_center_id'
+            )
+        )
+    )
+
+
 class ServiceCenterListView(generics.ListAPIView):
     """
     API endpoint for listing service centers (role-based access)
@@ -158,12 +235,16 @@ class ServiceCenterListView(generics.ListAPIView):
     def get_queryset(self):
         user = self.request.user
         if user.role == 'admin':
-            return ServiceCenter.objects.all()
+            queryset = ServiceCenter.objects.all()
         elif user.role == 'centeradmin':
-            return ServiceCenter.objects.filter(id=user.service_center.id)
+            queryset = ServiceCenter.objects.filter(id=user.service_center.id)
         else:
             return ServiceCenter.objects.none()
 
+        # Prefetch users and active subscriptions so the detail serializer's
+        # method fields don't issue 3 extra queries per service center
+        return _with_detail_relations(queryset)
+
 
 class ServiceCenterDetailView(generics.RetrieveUpdateDestroyAPIView):
     """
@@ -177,6 +258,14 @@ class ServiceCenterDetailView(generics.RetrieveUpdateDestroyAPIView):
             return ServiceCenterUpdateSerializer
         return ServiceCenterDetailSerializer
 
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.request.method == 'GET':
+            # Retrieval renders the detail serializer; fetch its relations
+            # up front instead of three follow-up queries
+            queryset = _with_detail_relations(queryset)
+        return queryset
+
     @swagger_auto_schema(
         operation_description="Retrieve service center details",
         operation_summary="Get Service Center Details",
@@ -534,7 +623,64 @@ def subscription_status(request, service_center_id):
         }, status=status.HTTP_400_BAD_REQUEST)
 
 
-class SubscriptionListView(generics.ListAPIView):
+def _stream_users_json(rows):
+    """
+    Yield a JSON array of user rows one row at a time.
+
+    Encoding per row keeps peak memory flat no matter how many users the
+    center has, instead of materializing the full list of dicts before
+    the renderer runs; iterator(chunk_size) bounds the DB-side buffering
+    the same way.
+    """
+    encoder = DjangoJSONEncoder()
+    yield '['
+    first = True
+    for row in rows.iterator(chunk_size=2000):
+        yield encoder.encode(row) if first else ',' + encoder.encode(row)
+        first = False
+    yield ']'
+
+
+@swagger_auto_schema(
+    method='get',
+    operation_description="Stream all users of a service center as a JSON array. Intended for large tenants where the regular detail endpoint's embedded user list would be too heavy.",
+    operation_summary="Stream Service Center Users",
+    responses={
+        200: openapi.Response(description="JSON array of user rows"),
+        403: openapi.Response(description="Permission denied"),
+        404: openapi.Response(description="Service center not found")
+    },
+    tags=['Service Centers']
+)
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def service_center_users_stream(request, service_center_id):
+    """
+    Streaming user list for one service center
+    """
+    user = request.user
+
+    # Permission check mirrors subscription_status
+    if user.role == 'admin':
+        service_center = get_object_or_404(ServiceCenter, id=service_center_id)
+    elif user.role in ['centeradmin', 'staff'] and user.service_center_id == service_center_id:
+        service_center = get_object_or_404(ServiceCenter, id=service_center_id)
+    else:
+        return Response({
+            'success': False,
+            'message': 'Permission denied'
+        }, status=status.HTTP_403_FORBIDDEN)
+
+    rows = CustomUser.objects.filter(service_center=service_center).values(
+        'id', 'username', 'email', 'phone_number', 'role',
+        'is_active', 'is_staff', 'date_joined', 'last_login'
+    )
+    return StreamingHttpResponse(
+        _stream_users_json(rows), content_type='application/json'
+    )
+
+
+class SubscriptionListView(AutoSelectRelatedMixin, generics.ListAPIView):
     """
     API endpoint for listing subscriptions
     """
@@ -573,6 +719,18 @@ class SubscriptionListView(generics.ListAPIView):
         else:
             return Subscription.objects.none()
 
+    pagination_class = RecentFirstCursorPagination
+
+    def list(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset())
+        # Cursor-paginate the values() rows directly so the fast path
+        # stays model-free; render_rows finishes only the page served
+        values_rows = SubscriptionSerializer.fast_queryset(queryset)
+        page = self.paginate_queryset(values_rows)
+        if page is not None:
+            return self.get_paginated_response(SubscriptionSerializer.render_rows(page))
+        return Response(SubscriptionSerializer.render_rows(values_rows))
+
 
 class UserRegistrationView(generics.CreateAPIView):
     """
@@ -687,7 +845,9 @@ def license_key_info(request, license_key):
     API endpoint to get license key information
     """
     try:
-        license_obj = get_object_or_404(LicenseKey, key=license_key)
+        license_obj = get_object_or_404(
+            LicenseKey.objects.select_related('assigned_to'), key=license_key
+        )
         
         response_data = {
             'success': True,
@@ -1129,7 +1289,7 @@ def get_subscription_status(request):
     }, status=status.HTTP_200_OK)
 
 
-class PaymentTransactionListView(generics.ListAPIView):
+class PaymentTransactionListView(AutoSelectRelatedMixin, generics.ListAPIView):
     """
     Get payment transaction history
     
@@ -1138,15 +1298,27 @@ class PaymentTransactionListView(generics.ListAPIView):
     """
     serializer_class = PaymentTransactionSerializer
     permission_classes = [IsCenterAdmin]
+    pagination_class = RecentFirstCursorPagination
 
     def get_queryset(self):
+        # The joins are inferred by AutoSelectRelatedMixin; only() keeps the
+        # joined rows down to the columns the serializer renders instead of
+        # dragging in the full user and service center rows
+        queryset = PaymentTransaction.objects.select_related(
+            'service_center', 'payment_plan', 'initiated_by'
+        ).only(
+            'id', 'transaction_id', 'service_center', 'payment_plan',
+            'transaction_type', 'status', 'amount', 'currency',
+            'razorpay_order_id', 'razorpay_payment_id', 'razorpay_signature',
+            'created_at', 'updated_at', 'completed_at', 'failure_reason',
+            'service_center__name', 'payment_plan__name', 'initiated_by__email',
+        ).order_by('-created_at')
+
         user = self.request.user
         if user.role == 'admin':
-            return PaymentTransaction.objects.all().order_by('-created_at')
+            return queryset
         else:
-            return PaymentTransaction.objects.filter(
-                service_center=user.service_center
-            ).order_by('-created_at')
+            return queryset.filter(service_center=user.service_center)
 
     @swagger_auto_schema(
         operation_description="Get payment transaction history",
@@ -1161,7 +1333,7 @@ class PaymentTransactionListView(generics.ListAPIView):
         return super().get(request, *args, **kwargs)
 
 
-class SubscriptionHistoryListView(generics.ListAPIView):
+class SubscriptionHistoryListView(AutoSelectRelatedMixin, generics.ListAPIView):
     """
     Get subscription history
     
@@ -1169,15 +1341,25 @@ class SubscriptionHistoryListView(generics.ListAPIView):
     """
     serializer_class = SubscriptionHistorySerializer
     permission_classes = [IsCenterAdmin]
+    pagination_class = RecentFirstCursorPagination
 
     def get_queryset(self):
+        # Same narrowing as the transaction list: joined rows carry only
+        # the columns the serializer renders
+        queryset = SubscriptionHistory.objects.select_related(
+            'service_center', 'payment_transaction'
+        ).only(
+            'id', 'service_center', 'payment_transaction', 'started_at',
+            'expires_at', 'previous_expires_at', 'plan_name', 'amount_paid',
+            'is_trial', 'is_extension', 'created_at',
+            'service_center__name', 'payment_transaction__transaction_id',
+        ).order_by('-created_at')
+
         user = self.request.user
         if user.role == 'admin':
-            return SubscriptionHistory.objects.all().order_by('-created_at')
+            return queryset
         else:
-            return SubscriptionHistory.objects.filter(
-                service_center=user.service_center
-            ).order_by('-created_at')
+            return queryset.filter(service_center=user.service_center)
 
     @swagger_auto_schema(
         operation_description="Get subscription history",
@@ -1212,65 +1394,57 @@ class SubscriptionHistoryListView(generics.ListAPIView):
 def payment_dashboard_stats(request):
     """Get payment dashboard statistics for admin"""
     
-    from datetime import datetime, timedelta
     from django.db.models import Sum, Count
-    
+
     # Calculate date range for monthly revenue
-    today = timezone.now().date()
+    now = timezone.now()
+    today = now.date()
     first_day_of_month = today.replace(day=1)
-    
-    # Revenue statistics
-    total_revenue = PaymentTransaction.objects.filter(
-        status='completed'
-    ).aggregate(
-        total=Sum('amount')
-    )['total'] or 0
-    
-    monthly_revenue = PaymentTransaction.objects.filter(
-        status='completed',
-        completed_at__date__gte=first_day_of_month
-    ).aggregate(
-        total=Sum('amount')
-    )['total'] or 0
-    
-    # Transaction statistics
+
+    # One conditional aggregate covers both revenue sums and all three
+    # transaction counters instead of a separate query per figure
     transaction_stats = PaymentTransaction.objects.aggregate(
+        total_revenue=Sum('amount', filter=Q(status='completed')),
+        monthly_revenue=Sum(
+            'amount',
+            filter=Q(status='completed', completed_at__date__gte=first_day_of_month)
+        ),
         total=Count('id'),
         successful=Count('id', filter=Q(status='completed')),
         failed=Count('id', filter=Q(status='failed'))
     )
-    
-    # Service center statistics
-    active_subscriptions = ServiceCenter.objects.filter(
-        subscription_valid_until__gte=today,
-        is_active=True
-    ).count()
-    
-    trial_centers = ServiceCenter.objects.filter(
-        trial_ends_at__gte=timezone.now(),
-        subscription_valid_until__isnull=True,
-        is_active=True
-    ).count()
-    
-    expired_centers = ServiceCenter.objects.filter(
-        Q(subscription_valid_until__lt=today) | Q(trial_ends_at__lt=timezone.now()),
-        is_active=True
-    ).count()
-    
-    # Recent transactions
+
+    # Same collapse for the three service center counters
+    center_stats = ServiceCenter.objects.filter(is_active=True).aggregate(
+        active_subscriptions=Count(
+            'id', filter=Q(subscription_valid_until__gte=today)
+        ),
+        trial_centers=Count(
+            'id',
+            filter=Q(trial_ends_at__gte=now, subscription_valid_until__isnull=True)
+        ),
+        expired_centers=Count(
+            'id',
+            filter=Q(subscription_valid_until__lt=today) | Q(trial_ends_at__lt=now)
+        )
+    )
+
+    # Recent transactions, joined up front for the serializer's dotted sources
     recent_transactions = PaymentTransaction.objects.filter(
         status='completed'
+    ).select_related(
+        'service_center', 'payment_plan', 'initiated_by'
     ).order_by('-completed_at')[:10]
-    
+
     dashboard_data = {
-        'total_revenue': total_revenue,
-        'monthly_revenue': monthly_revenue,
+        'total_revenue': transaction_stats['total_revenue'] or 0,
+        'monthly_revenue': transaction_stats['monthly_revenue'] or 0,
         'total_transactions': transaction_stats['total'],
         'successful_transactions': transaction_stats['successful'],
         'failed_transactions': transaction_stats['failed'],
-        'active_subscriptions': active_subscriptions,
-        'trial_centers': trial_centers,
-        'expired_centers': expired_centers,
+        'active_subscriptions': center_stats['active_subscriptions'],
+        'trial_centers': center_stats['trial_centers'],
+        'expired_centers': center_stats['expired_centers'],
         'recent_transactions': PaymentTransactionSerializer(
             recent_transactions, many=True
         ).data
@@ -1414,7 +1588,32 @@ class ServiceCenterPaymentStatusListView(generics.ListAPIView):
     """
     serializer_class = ServiceCenterPaymentStatusSerializer
     permission_classes = [IsAdmin]
-    queryset = ServiceCenter.objects.all().order_by('-created_at')
+    # Sliced prefetch hands each center its three newest completed
+    # transactions in one window-function query; the serializer reads the
+    # recent_completed cache instead of querying per row, and the filtered
+    # Sum annotation replaces one aggregate query per center
+    # only() narrows the row to the columns the serializer and the status
+    # computation actually touch
+    queryset = ServiceCenter.objects.only(
+        'id', 'name', 'email', 'license_key', 'is_active',
+        'trial_started_at', 'trial_ends_at',
+        'subscription_started_at', 'subscription_valid_until', 'created_at'
+    ).order_by('-created_at').annotate(
+        total_paid_amount=Sum(
+            'payment_transactions__amount',
+            filter=Q(payment_transactions__status='completed')
+        )
+    ).prefetch_related(
+        Prefetch(
+            'payment_transactions',
+            queryset=PaymentTransaction.objects.filter(
+                status='completed'
+            ).select_related(
+                'service_center', 'payment_plan', 'initiated_by'
+            ).order_by('-completed_at')[:3],
+            to_attr='recent_completed'
+        )
+    )
 
     @swagger_auto_schema(
         operation_description="Get all service centers with payment status",
@@ -1616,12 +1815,14 @@ class UserManagementViewSet(viewsets.ModelViewSet):
             serializer = self.get_serializer(page, many=True)
             return self.get_paginated_response(serializer.data)
         
-        serializer = self.get_serializer(queryset, many=True)
+        # values()-backed fast path: no model or serializer instantiation
+        # per row, and len() of the rows replaces the extra count() query
+        results = UserListSerializer.fast_list(queryset)
         return Response({
-            'count': queryset.count(),
-            'results': serializer.data
+            'count': len(results),
+            'results': results
         })
-    
+
     def create(self, request, *args, **kwargs):
         """Create a new staff user - service center is automatically assigned"""
         # Check if user can create staff
@@ -1836,16 +2037,15 @@ class UserManagementViewSet(viewsets.ModelViewSet):
                 'error': 'Only admins and center admins can view service center users'
             }, status=status.HTTP_403_FORBIDDEN)
         
-        queryset = self.get_queryset()
-        serializer = UserListSerializer(queryset, many=True)
-        
+        users = UserListSerializer.fast_list(self.get_queryset())
+
         return Response({
             'service_center': {
                 'id': request.user.service_center.id if request.user.service_center else None,
                 'name': request.user.service_center.name if request.user.service_center else 'All Service Centers'
             },
-            'users': serializer.data,
-            'count': queryset.count()
+            'users': users,
+            'count': len(users)
         }, status=status.HTTP_200_OK)
 
 
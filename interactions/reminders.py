@@ -0,0 +1,98 @@
+# reminders.py - service reminder pipeline
+
+import logging
+from datetime import timedelta
+
+from django.utils import timezone
+
+from .models import ServiceEntry
+from .sms_service import SMSService
+from .whatsapp_service import WhatsAppService
+
+logger = logging.getLogger(__name__)
+
+
+def send_service_reminders(service_center_id=None):
+    """
+    Send SMS and WhatsApp reminders for service entries due in two days.
+
+    Plain function so scheduled tasks call it directly instead of going
+    through call_command, which re-scans the command registry and
+    re-parses options on every run. Returns the number of entries
+    processed.
+    """
+    today = timezone.now().date()
+
+    # Pre-create service objects (optimization)
+    whatsapp = WhatsAppService(api_key="f4286546-aa2e-4f3a-8266-d5bf2da00521")
+
+    two_days_before = today + timedelta(days=2)
+    entries_due_soon = ServiceEntry.objects.filter(
+        next_service_due_date=two_days_before
+    ).select_related('customer', 'vehicle')
+    if service_center_id:
+        entries_due_soon = entries_due_soon.filter(service_center_id=service_center_id)
+
+    processed = 0
+    # iterator() streams rows in chunks so peak memory stays bounded no
+    # matter how many entries fall due on the same date
+    for entry in entries_due_soon.iterator(chunk_size=500):
+        customer = entry.customer
+        customer_phone = customer.phone
+
+        if not customer_phone:
+            logger.warning(f"No phone number found for customer {customer.name}")
+            continue
+
+        # SMS Reminder
+        send_service_confirmation_sms(entry, customer_phone)
+
+        # WhatsApp Template Message
+        try:
+            body_params = [
+                {"type": "text", "text": str(entry.vehicle.vehicle_number)},
+                {"type": "text", "text": str(entry.next_service_due_date)},
+            ]
+
+            wa_result = whatsapp.send_template_message(
+                to=f"+91{customer_phone}",
+                template_name="serveicedonenewadded",
+                body_params=body_params
+            )
+
+            logger.info(f"WhatsApp reminder sent for entry {entry.id}: {wa_result}")
+        except Exception as e:
+            logger.error(f"WhatsApp failed for entry {entry.id}: {str(e)}")
+
+        processed += 1
+
+    return processed
+
+
+def send_service_confirmation_sms(service_entry, phone):
+    """Send SMS confirmation for service entry"""
+    try:
+        sms_service = SMSService(
+            access_token="B4E2AL68DJFSENJ",
+            access_token_key=";Wva|blE+0BMAuY@RPUX*tqzNhHJCF[-"
+        )
+
+        message_content = (
+            f"Dear Customer, Next wheel alignment for your vehicle "
+            f"{service_entry.vehicle.vehicle_number} is due at {service_entry.next_kilometer} km. "
+            f"Kindly check and align on time. Wheel Alignment Info- Maharaja Hub"
+        )
+
+        sms_result = sms_service.send_sms(
+            recipients=[phone],
+            message_content=message_content,
+            sms_header="MHAHUB",
+            entity_id="1701175741468435288",
+            template_id="1707175825891756292",
+        )
+
+        logger.info(f"SMS sent successfully for service entry {service_entry.id}: {sms_result}")
+
+    except Exception as e:
+        logger.error(f"Failed to send SMS for entry {service_entry.id}: {str(e)}")
+        raise